@@ -1,7 +1,21 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
+from dataclasses import dataclass, field
 from typing import Tuple, Callable
 
+try:
+    from scipy.optimize import brentq, newton
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    import numba as nb
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 def validasi_parameter(R: float, L: float, C: float) -> None:
     """
     Memvalidasi parameter rangkaian RLC.
@@ -21,89 +35,235 @@ def validasi_parameter(R: float, L: float, C: float) -> None:
     if R < 0:  # R bisa 0 untuk kasus ideal
         raise ValueError(f"Resistansi (R) tidak boleh negatif, nilai sekarang: {R}")
 
-def f_R(R: float, L: float, C: float) -> float:
+@dataclass(frozen=True)
+class RLCParams:
     """
-    Menghitung frekuensi resonansi untuk parameter rangkaian RLC yang diberikan.
+    Parameter rangkaian RLC beserta konstanta turunan yang dihitung sekali.
     
     Parameter:
-        R (float): Resistansi dalam ohm
         L (float): Induktansi dalam henry
         C (float): Kapasitansi dalam mikrofarad
         
+    Atribut turunan:
+        inv_LC (float): 1/(LC) dengan C dalam farad
+        four_L2 (float): 4L²
+        two_pi (float): 2π
+        R_maks (float): R terbesar yang masih menghasilkan frekuensi real, 2L√(1/(LC))
+    """
+    L: float
+    C: float
+    inv_LC: float = field(init=False)
+    four_L2: float = field(init=False)
+    two_pi: float = field(init=False, default=2*np.pi)
+    R_maks: float = field(init=False)
+    
+    def __post_init__(self) -> None:
+        validasi_parameter(0, self.L, self.C)
+        object.__setattr__(self, 'inv_LC', 1.0/(self.L*self.C*1e-6))  # Konversi μF ke F
+        object.__setattr__(self, 'four_L2', 4.0*self.L*self.L)
+        object.__setattr__(self, 'R_maks', math.sqrt(self.four_L2*self.inv_LC))
+
+def f_R(R: float, params: RLCParams) -> float:
+    """
+    Menghitung frekuensi resonansi untuk parameter rangkaian RLC yang diberikan.
+    
+    Parameter:
+        R (float): Resistansi dalam ohm
+        params (RLCParams): Parameter rangkaian
+        
     Keluaran:
         float: Frekuensi resonansi dalam Hz
     """
-    validasi_parameter(R, L, C)
+    if R < 0:  # R bisa 0 untuk kasus ideal
+        raise ValueError(f"Resistansi (R) tidak boleh negatif, nilai sekarang: {R}")
     
-    C = C * 1e-6  # Konversi μF ke F
-    term_under_sqrt = 1/(L*C) - (R**2)/(4*L**2)
+    term_under_sqrt = params.inv_LC - R*R/params.four_L2
     
     if term_under_sqrt <= 0:
         raise ValueError(f"Nilai R terlalu besar, menghasilkan frekuensi imajiner. R={R}")
         
-    return (1/(2*np.pi)) * np.sqrt(term_under_sqrt)
+    return np.sqrt(term_under_sqrt) / params.two_pi
+
+def f_R_vec(R: np.ndarray, params: RLCParams) -> np.ndarray:
+    """
+    Menghitung frekuensi resonansi untuk array nilai resistansi sekaligus.
+    
+    Parameter:
+        R (numpy.ndarray): Array resistansi dalam ohm
+        params (RLCParams): Parameter rangkaian
+        
+    Keluaran:
+        numpy.ndarray: Frekuensi resonansi dalam Hz, NaN jika frekuensi imajiner
+    """
+    R = np.asarray(R, dtype=float)
+    term_under_sqrt = params.inv_LC - R*R/params.four_L2
+    
+    f = np.full_like(R, np.nan)
+    valid = term_under_sqrt > 0
+    f[valid] = np.sqrt(term_under_sqrt[valid]) / params.two_pi
+    return f
 
-def F_R(R: float, target_f: float, L: float, C: float) -> float:
+def F_R(R: float, target_f: float, params: RLCParams) -> float:
     """
     Menghitung selisih antara frekuensi yang dihitung dengan frekuensi target.
+    
+    Input skalar dihitung dengan math.sqrt; input array dihitung tanpa
+    percabangan per elemen menggunakan np.where.
+    """
+    term_under_sqrt = params.inv_LC - R*R/params.four_L2
+    # Untuk metode numerik, kita return nilai besar jika perhitungan tidak valid
+    if isinstance(R, np.ndarray):
+        valid = (term_under_sqrt > 0) & (R >= 0)
+        f = np.where(valid, np.sqrt(np.maximum(term_under_sqrt, 0.0))/params.two_pi, np.inf)
+        return f - target_f
+    
+    if term_under_sqrt > 0 and R >= 0:
+        return math.sqrt(term_under_sqrt)/params.two_pi - target_f
+    return math.inf
+
+def R_analitik(params: RLCParams, target_f: float) -> float:
+    """
+    Menghitung nilai R secara analitik dari persamaan frekuensi resonansi.
+    
+    Persamaan f = (1/2π)√(1/(LC) - R²/(4L²)) dapat dibalik menjadi
+    R = 2L√(1/(LC) - (2πf)²).
+    
+    Parameter:
+        params (RLCParams): Parameter rangkaian
+        target_f (float): Frekuensi target dalam Hz
+        
+    Keluaran:
+        float: Resistansi dalam ohm
+    """
+    term_under_sqrt = params.inv_LC - (params.two_pi*target_f)**2
+    
+    if term_under_sqrt < 0:
+        raise ValueError(f"Frekuensi target {target_f} Hz melebihi frekuensi maksimum rangkaian")
+        
+    return 2*params.L * np.sqrt(term_under_sqrt)
+
+def cari_interval(params: RLCParams, target_f: float, n_titik: int = 256) -> Tuple[float, float]:
+    """
+    Mencari interval [a,b] yang mengandung akar F_R dengan mengevaluasi
+    F_R pada grid R secara tervektorisasi.
+    
+    Grid mencakup 0 sampai tepat di bawah R maksimum yang masih menghasilkan
+    frekuensi real, yaitu R = 2L√(1/(LC)), sehingga frekuensi target yang
+    sangat kecil tetap dapat dikurung. Jika akar tepat berada pada titik
+    grid, interval yang dikembalikan adalah [akar, akar].
+    
+    Parameter:
+        params (RLCParams): Parameter rangkaian
+        target_f (float): Frekuensi target dalam Hz
+        n_titik (int): Jumlah titik grid
+        
+    Keluaran:
+        Tuple[float, float]: Batas interval a dan b
     """
-    try:
-        return f_R(R, L, C) - target_f
-    except ValueError as e:
-        # Untuk metode numerik, kita return nilai besar jika perhitungan tidak valid
-        return float('inf')
+    grid = np.linspace(0, params.R_maks * (1 - 1e-12), n_titik)
+    nilai = F_R(grid, target_f, params)
+    
+    akar_tepat = np.nonzero(nilai == 0)[0]
+    if len(akar_tepat) > 0:
+        return grid[akar_tepat[0]], grid[akar_tepat[0]]
+    
+    perubahan_tanda = np.nonzero(np.diff(np.sign(nilai)))[0]
+    if len(perubahan_tanda) == 0:
+        raise ValueError(f"Tidak ditemukan interval yang mengandung akar untuk frekuensi {target_f} Hz")
+    
+    idx = perubahan_tanda[0]
+    return grid[idx], grid[idx + 1]
 
-def bisection_method(f: Callable, a: float, b: float, tol: float, L: float, C: float, target_f: float, max_iter: int = 100) -> Tuple[float, int]:
+def bisection_method(f: Callable, a: float, b: float, tol: float, params: RLCParams, target_f: float, max_iter: int = 100) -> Tuple[float, int]:
     """
     Mencari akar menggunakan metode biseksi.
+    
+    Jika f adalah F_R dan Numba tersedia, perhitungan dijalankan oleh
+    kernel bisect_rlc yang sudah dikompilasi.
     """
-    if f(a, target_f, L, C) * f(b, target_f, L, C) >= 0:
+    if NUMBA_AVAILABLE and f is F_R:
+        akar, iterasi, status = bisect_rlc(a, b, tol, params.inv_LC, params.four_L2,
+                                           params.two_pi, target_f, max_iter)
+        if status == STATUS_INTERVAL_TANPA_AKAR:
+            raise ValueError("Interval [a,b] tidak mengandung akar. Coba interval lain.")
+        if status == STATUS_TIDAK_KONVERGEN:
+            raise RuntimeError(f"Metode biseksi tidak konvergen setelah {max_iter} iterasi")
+        return akar, iterasi
+    
+    fa = f(a, target_f, params)
+    fb = f(b, target_f, params)
+    if fa == 0:
+        return a, 0
+    if fb == 0:
+        return b, 0
+    if fa * fb >= 0:
         raise ValueError("Interval [a,b] tidak mengandung akar. Coba interval lain.")
     
     iterasi = 0
     while (b - a) / 2 > tol and iterasi < max_iter:
         c = (a + b) / 2
-        fc = f(c, target_f, L, C)
+        fc = f(c, target_f, params)
         
         if abs(fc) < tol:
             return c, iterasi
-        elif f(c, target_f, L, C) * f(a, target_f, L, C) < 0:
+        elif fc * fa < 0:
             b = c
+            fb = fc
         else:
             a = c
+            fa = fc
         iterasi += 1
     
     if iterasi == max_iter:
         raise RuntimeError(f"Metode biseksi tidak konvergen setelah {max_iter} iterasi")
     
+    # Perubahan tanda menuju nilai tak hingga (R di luar domain) bukan akar
+    if math.isinf(fa) or math.isinf(fb):
+        raise ValueError("Interval [a,b] tidak mengandung akar. Coba interval lain.")
+    
     return (a + b) / 2, iterasi
 
-def dF_R(R: float, L: float, C: float) -> float:
+def dF_R(R: float, params: RLCParams) -> float:
     """
     Menghitung turunan F_R terhadap R.
     """
-    C = C * 1e-6  # Konversi μF ke F
-    term_under_sqrt = 1/(L*C) - R**2/(4*L**2)
+    term_under_sqrt = params.inv_LC - R*R/params.four_L2
     
     if term_under_sqrt <= 0:
         raise ValueError("Turunan tidak terdefinisi - nilai di bawah akar kuadrat negatif")
         
-    return -R/(4*np.pi*L**2 * np.sqrt(term_under_sqrt))
+    return -R/(params.two_pi * params.four_L2 * np.sqrt(term_under_sqrt))
 
-def newton_raphson(f: Callable, df: Callable, x0: float, tol: float, L: float, C: float, target_f: float, max_iter: int = 100) -> Tuple[float, int]:
+def newton_raphson(f: Callable, df: Callable, x0: float, tol: float, params: RLCParams, target_f: float, max_iter: int = 100) -> Tuple[float, int]:
     """
     Mencari akar menggunakan metode Newton-Raphson.
+    
+    Jika f dan df adalah F_R dan dF_R serta Numba tersedia, perhitungan
+    dijalankan oleh kernel newton_rlc yang sudah dikompilasi.
     """
+    if NUMBA_AVAILABLE and f is F_R and df is dF_R:
+        akar, iterasi, status = newton_rlc(x0, tol, params.inv_LC, params.four_L2,
+                                           params.two_pi, target_f, max_iter)
+        if status == STATUS_TURUNAN_TIDAK_TERDEFINISI:
+            raise RuntimeError(f"Metode Newton-Raphson gagal pada iterasi {iterasi}: "
+                               "Turunan tidak terdefinisi - nilai di bawah akar kuadrat negatif")
+        if status == STATUS_TURUNAN_NOL:
+            raise RuntimeError(f"Metode Newton-Raphson gagal pada iterasi {iterasi}: "
+                               "Turunan terlalu kecil - metode tidak dapat dilanjutkan")
+        if status == STATUS_TIDAK_KONVERGEN:
+            raise RuntimeError(f"Metode Newton-Raphson tidak konvergen setelah {max_iter} iterasi")
+        return akar, iterasi
+    
     x = x0
     iterasi = 0
     
     while iterasi < max_iter:
         try:
-            fx = f(x, target_f, L, C)
+            fx = f(x, target_f, params)
             if abs(fx) < tol:
                 return x, iterasi
             
-            dfx = df(x, L, C)
+            dfx = df(x, params)
             if abs(dfx) < 1e-10:  # Mencegah pembagian dengan nol
                 raise ValueError("Turunan terlalu kecil - metode tidak dapat dilanjutkan")
                 
@@ -122,6 +282,96 @@ def newton_raphson(f: Callable, df: Callable, x0: float, tol: float, L: float, C
     
     raise RuntimeError(f"Metode Newton-Raphson tidak konvergen setelah {max_iter} iterasi")
 
+# Kode status kernel terkompilasi (Numba tidak mendukung pesan error dinamis)
+STATUS_OK = 0
+STATUS_TIDAK_KONVERGEN = 1
+STATUS_INTERVAL_TANPA_AKAR = 2
+STATUS_TURUNAN_NOL = 3
+STATUS_TURUNAN_TIDAK_TERDEFINISI = 4
+
+def bisect_rlc(a: float, b: float, tol: float, inv_LC: float, four_L2: float, two_pi: float,
+               target_f: float, max_iter: int) -> Tuple[float, int, int]:
+    """
+    Metode biseksi khusus untuk F_R dengan perhitungan frekuensi di-inline.
+    
+    Keluaran:
+        Tuple[float, int, int]: Akar, jumlah iterasi, dan kode status
+    """
+    term_a = inv_LC - a*a/four_L2
+    fa = math.sqrt(term_a)/two_pi - target_f if a >= 0 and term_a > 0 else math.inf
+    term_b = inv_LC - b*b/four_L2
+    fb = math.sqrt(term_b)/two_pi - target_f if b >= 0 and term_b > 0 else math.inf
+    if fa == 0:
+        return a, 0, STATUS_OK
+    if fb == 0:
+        return b, 0, STATUS_OK
+    if fa * fb >= 0:
+        return math.nan, 0, STATUS_INTERVAL_TANPA_AKAR
+    
+    iterasi = 0
+    while (b - a) / 2 > tol and iterasi < max_iter:
+        c = (a + b) / 2
+        term_c = inv_LC - c*c/four_L2
+        fc = math.sqrt(term_c)/two_pi - target_f if c >= 0 and term_c > 0 else math.inf
+        
+        if abs(fc) < tol:
+            return c, iterasi, STATUS_OK
+        elif fc * fa < 0:
+            b = c
+            fb = fc
+        else:
+            a = c
+            fa = fc
+        iterasi += 1
+    
+    if iterasi == max_iter:
+        return math.nan, iterasi, STATUS_TIDAK_KONVERGEN
+    
+    # Perubahan tanda menuju nilai tak hingga (R di luar domain) bukan akar
+    if math.isinf(fa) or math.isinf(fb):
+        return math.nan, iterasi, STATUS_INTERVAL_TANPA_AKAR
+    
+    return (a + b) / 2, iterasi, STATUS_OK
+
+def newton_rlc(x0: float, tol: float, inv_LC: float, four_L2: float, two_pi: float,
+               target_f: float, max_iter: int) -> Tuple[float, int, int]:
+    """
+    Metode Newton-Raphson khusus untuk F_R dan dF_R dengan perhitungan di-inline.
+    
+    Keluaran:
+        Tuple[float, int, int]: Akar, jumlah iterasi, dan kode status
+    """
+    x = x0
+    iterasi = 0
+    
+    while iterasi < max_iter:
+        term = inv_LC - x*x/four_L2
+        fx = math.sqrt(term)/two_pi - target_f if x >= 0 and term > 0 else math.inf
+        if abs(fx) < tol:
+            return x, iterasi, STATUS_OK
+        
+        if term <= 0:
+            return math.nan, iterasi, STATUS_TURUNAN_TIDAK_TERDEFINISI
+        dfx = -x/(two_pi * four_L2 * math.sqrt(term))
+        if abs(dfx) < 1e-10:  # Mencegah pembagian dengan nol
+            return math.nan, iterasi, STATUS_TURUNAN_NOL
+            
+        x_new = x - fx/dfx
+        if x_new < 0:  # Mencegah nilai R negatif
+            x_new = abs(x_new)
+        
+        if abs(x_new - x) < tol:
+            return x_new, iterasi, STATUS_OK
+            
+        x = x_new
+        iterasi += 1
+    
+    return math.nan, iterasi, STATUS_TIDAK_KONVERGEN
+
+if NUMBA_AVAILABLE:
+    bisect_rlc = nb.njit(cache=True)(bisect_rlc)
+    newton_rlc = nb.njit(cache=True)(newton_rlc)
+
 # Parameter rangkaian yang diberikan
 L = 0.5  # H
 C = 10   # μF
@@ -136,37 +386,59 @@ print(f"Toleransi = {tol} Ω")
 print("\nMencari nilai R yang menghasilkan frekuensi resonansi 1000 Hz...")
 
 try:
-    # Cek apakah parameter dasar valid
-    validasi_parameter(0, L, C)  # Cek dengan R=0 untuk parameter L dan C
+    # Cek apakah parameter dasar valid dan hitung konstanta rangkaian sekali
+    params = RLCParams(L, C)
     
     # Cari frekuensi maksimum (saat R=0)
-    f_max = f_R(0, L, C)
+    f_max = f_R(0, params)
     if target_f > f_max:
         raise ValueError(f"Frekuensi target {target_f} Hz tidak mungkin dicapai. "
                         f"Frekuensi maksimum yang mungkin adalah {f_max:.2f} Hz (saat R=0)")
     
-    # Metode biseksi
-    print("\nMenggunakan metode biseksi...")
-    R_biseksi, iter_biseksi = bisection_method(F_R, 0, 100, tol, L, C, target_f)
+    # Solusi analitik sebagai acuan
+    R_eksak = R_analitik(params, target_f)
+    if not np.isclose(f_R(R_eksak, params), target_f):
+        raise RuntimeError(f"Solusi analitik R={R_eksak} tidak memenuhi frekuensi target")
     
-    # Metode Newton-Raphson
-    print("Menggunakan metode Newton-Raphson...")
-    R_newton, iter_newton = newton_raphson(F_R, dF_R, 50, tol, L, C, target_f)
+    # Interval awal untuk metode pengurung
+    a, b = cari_interval(params, target_f)
+    
+    # Tebakan awal Newton; untuk akar yang jauh dari 50 Ω langkah pertama dapat
+    # melewati R maksimum sehingga turunan tidak terdefinisi
+    x0 = 50
+    
+    if SCIPY_AVAILABLE:
+        # Metode Brent (biseksi hibrida) dan Newton-Raphson dari SciPy
+        nama_metode_kurung = "Brent"
+        print("\nMenggunakan metode Brent (scipy.optimize.brentq)...")
+        R_biseksi, hasil_biseksi = brentq(F_R, a, b, args=(target_f, params),
+                                          xtol=tol, full_output=True)
+        iter_biseksi = hasil_biseksi.iterations
+        
+        print("Menggunakan metode Newton-Raphson (scipy.optimize.newton)...")
+        R_newton, hasil_newton = newton(F_R, x0, fprime=lambda R, target_f, params: dF_R(R, params),
+                                        args=(target_f, params), tol=tol, full_output=True)
+        iter_newton = hasil_newton.iterations
+    else:
+        # Metode biseksi
+        nama_metode_kurung = "Biseksi"
+        print("\nMenggunakan metode biseksi...")
+        R_biseksi, iter_biseksi = bisection_method(F_R, a, b, tol, params, target_f)
+        
+        # Metode Newton-Raphson
+        print("Menggunakan metode Newton-Raphson...")
+        R_newton, iter_newton = newton_raphson(F_R, dF_R, x0, tol, params, target_f)
     
     # Membuat visualisasi
     R_values = np.linspace(0, max(R_biseksi, R_newton)*1.5, 1000)
-    f_values = []
-    for R in R_values:
-        try:
-            f_values.append(f_R(R, L, C))
-        except ValueError:
-            f_values.append(np.nan)
+    f_values = f_R_vec(R_values, params)
     
     plt.figure(figsize=(12, 6))
     plt.plot(R_values, f_values, 'b-', label='Frekuensi vs Resistansi')
     plt.axhline(y=target_f, color='r', linestyle='--', label=f'Frekuensi Target ({target_f} Hz)')
-    plt.plot(R_biseksi, f_R(R_biseksi, L, C), 'go', label='Solusi Metode Biseksi')
-    plt.plot(R_newton, f_R(R_newton, L, C), 'mo', label='Solusi Newton-Raphson')
+    plt.plot(R_eksak, target_f, 'k*', markersize=12, label='Solusi Analitik')
+    plt.plot(R_biseksi, f_R(R_biseksi, params), 'go', label=f'Solusi Metode {nama_metode_kurung}')
+    plt.plot(R_newton, f_R(R_newton, params), 'mo', label='Solusi Newton-Raphson')
     plt.xlabel('Resistansi (Ω)')
     plt.ylabel('Frekuensi (Hz)')
     plt.title('Frekuensi Resonansi Rangkaian RLC vs Resistansi')
@@ -175,15 +447,20 @@ try:
     
     print(f"""
 Hasil:
-Metode Biseksi:
+Solusi Analitik:
+- R = {R_eksak:.4f} Ω
+
+Metode {nama_metode_kurung}:
 - R = {R_biseksi:.4f} Ω
 - Jumlah iterasi: {iter_biseksi}
-- Frekuensi akhir: {f_R(R_biseksi, L, C):.2f} Hz
+- Frekuensi akhir: {f_R(R_biseksi, params):.2f} Hz
+- Selisih dengan solusi analitik: {abs(R_biseksi - R_eksak):.4f} Ω
 
 Metode Newton-Raphson:
 - R = {R_newton:.4f} Ω
 - Jumlah iterasi: {iter_newton}
-- Frekuensi akhir: {f_R(R_newton, L, C):.2f} Hz
+- Frekuensi akhir: {f_R(R_newton, params):.2f} Hz
+- Selisih dengan solusi analitik: {abs(R_newton - R_eksak):.4f} Ω
     """)
     
 except ValueError as e:
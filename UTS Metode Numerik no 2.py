@@ -1,35 +1,48 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def eliminasi_gauss(A, b):
+def eliminasi_gauss(A, b, maks_langkah=4, tampilkan_langkah=True):
     """
     Menyelesaikan sistem persamaan linear menggunakan metode eliminasi Gauss.
     
     Parameter:
         A (numpy.ndarray): Matriks koefisien
         b (numpy.ndarray): Vektor konstanta
+        maks_langkah (int): Jumlah maksimum langkah yang disimpan untuk visualisasi
+        tampilkan_langkah (bool): Jika False, sistem diselesaikan langsung dengan
+            np.linalg.solve (LAPACK) tanpa mencatat langkah
     
     Hasil:
         numpy.ndarray: Vektor solusi
         list: Langkah-langkah proses eliminasi untuk visualisasi
     """
+    if not tampilkan_langkah:
+        return np.linalg.solve(A, b), []
+    
     n = len(A)
-    # Menggabungkan A dan b menjadi matriks augmented
-    Ab = np.concatenate((A, b.reshape(n, 1)), axis=1)
+    # Menggabungkan A dan b menjadi matriks augmented tanpa array perantara
+    Ab = np.empty((n, n + 1), dtype=np.result_type(A, b, float))
+    Ab[:, :n] = A
+    Ab[:, n] = np.ravel(b)
     langkah = [Ab.copy()]
     
     # Eliminasi maju
     for i in range(n):
-        # Mencari pivot
-        pivot = Ab[i][i]
-        if pivot == 0:
+        # Mencari pivot (pivoting parsial)
+        p = i + np.argmax(np.abs(Ab[i:, i]))
+        if Ab[p][i] == 0:
             raise ValueError("Matriks singular atau hampir singular")
+        if p != i:
+            Ab[[i, p]] = Ab[[p, i]]
+        pivot = Ab[i][i]
             
-        # Eliminasi kolom i
-        for j in range(i + 1, n):
-            faktor = Ab[j][i] / pivot
-            Ab[j] = Ab[j] - faktor * Ab[i]
-            langkah.append(Ab.copy())
+        # Eliminasi kolom i untuk semua baris di bawah pivot sekaligus
+        # (kolom terakhir tidak memiliki baris di bawah pivot)
+        if i < n - 1:
+            faktor = Ab[i+1:, i] / pivot
+            Ab[i+1:, i:] -= faktor[:, None] * Ab[i, i:]
+            if len(langkah) < maks_langkah:
+                langkah.append(Ab.copy())
     
     # Substitusi mundur
     x = np.zeros(n)
@@ -38,10 +51,43 @@ def eliminasi_gauss(A, b):
     
     return x, langkah
 
+def determinan_lu(A):
+    """
+    Menghitung determinan menggunakan dekomposisi LU dengan pivoting parsial.
+    
+    Determinan adalah hasil kali diagonal U dikalikan tanda dari
+    pertukaran baris yang dilakukan.
+    
+    Parameter:
+        A (numpy.ndarray): Matriks persegi
+    
+    Hasil:
+        float: Determinan matriks
+    """
+    M = np.array(A, dtype=float)
+    n = len(M)
+    tanda = 1.0
+    
+    for i in range(n):
+        p = i + np.argmax(np.abs(M[i:, i]))
+        if M[p][i] == 0:
+            return 0.0
+        if p != i:
+            M[[i, p]] = M[[p, i]]
+            tanda = -tanda
+        
+        M[i+1:, i:] -= (M[i+1:, i:i+1] / M[i][i]) * M[i, i:]
+    
+    return tanda * np.prod(np.diag(M))
+
 def determinan_kofaktor(A):
     """
     Menghitung determinan menggunakan ekspansi kofaktor.
     
+    Ekspansi kofaktor berorde O(n!), sehingga hanya dipakai untuk matriks
+    berukuran sampai 3x3; matriks yang lebih besar dihitung dengan
+    determinan_lu yang berorde O(n^3).
+    
     Parameter:
         A (numpy.ndarray): Matriks persegi
     
@@ -54,6 +100,9 @@ def determinan_kofaktor(A):
     if len(A) == 2:
         return A[0][0] * A[1][1] - A[0][1] * A[1][0]
     
+    if len(A) > 3:
+        return determinan_lu(A)
+    
     det = 0
     for j in range(len(A)):
         det += ((-1) ** j) * A[0][j] * determinan_kofaktor(
@@ -61,51 +110,74 @@ def determinan_kofaktor(A):
     
     return det
 
-def gauss_jordan(A, b):
+def gauss_jordan(A, b, maks_langkah=4):
     """
     Menyelesaikan sistem persamaan linear menggunakan metode eliminasi Gauss-Jordan.
     
     Parameter:
         A (numpy.ndarray): Matriks koefisien
         b (numpy.ndarray): Vektor konstanta
+        maks_langkah (int): Jumlah maksimum langkah yang disimpan untuk visualisasi
     
     Hasil:
         numpy.ndarray: Vektor solusi
         list: Langkah-langkah proses eliminasi
     """
     n = len(A)
-    Ab = np.concatenate((A, b.reshape(n, 1)), axis=1)
+    Ab = np.empty((n, n + 1), dtype=np.result_type(A, b, float))
+    Ab[:, :n] = A
+    Ab[:, n] = np.ravel(b)
     langkah = [Ab.copy()]
     
     # Eliminasi maju
     for i in range(n):
-        pivot = Ab[i][i]
-        if pivot == 0:
+        # Mencari pivot (pivoting parsial)
+        p = i + np.argmax(np.abs(Ab[i:, i]))
+        if Ab[p][i] == 0:
             raise ValueError("Matriks singular atau hampir singular")
+        if p != i:
+            Ab[[i, p]] = Ab[[p, i]]
+        pivot = Ab[i][i]
             
-        # Normalisasi baris i
-        Ab[i] = Ab[i] / pivot
-        langkah.append(Ab.copy())
+        # Normalisasi baris i; baris pivot disimpan sebagai array kontigu
+        # agar hanya dibaca sekali saat eliminasi
+        pivot_row = Ab[i, i:] / pivot
+        Ab[i, i:] = pivot_row
+        if len(langkah) < maks_langkah:
+            langkah.append(Ab.copy())
         
-        # Eliminasi kolom i
-        for j in range(n):
-            if i != j:
-                faktor = Ab[j][i]
-                Ab[j] = Ab[j] - faktor * Ab[i]
-                langkah.append(Ab.copy())
+        # Eliminasi kolom i untuk semua baris selain baris pivot sekaligus
+        # (kolom sebelum i pada baris pivot sudah nol)
+        mask = np.arange(n) != i
+        Ab[mask, i:] -= Ab[mask, i:i+1] * pivot_row
+        if len(langkah) < maks_langkah:
+            langkah.append(Ab.copy())
     
     return Ab[:, -1], langkah
 
-def invers_matriks_adjoin(A):
+def invers_matriks_adjoin(A, metode='lapack'):
     """
-    Menghitung invers matriks menggunakan metode adjoin.
+    Menghitung invers matriks.
+    
+    Secara bawaan invers dihitung dengan np.linalg.inv (LAPACK, O(n^3)).
+    Metode adjoin yang memerlukan n^2 + 1 determinan tetap tersedia untuk
+    keperluan pembelajaran.
     
     Parameter:
         A (numpy.ndarray): Matriks persegi
+        metode (str): 'lapack' atau 'adjoin'
     
     Hasil:
         numpy.ndarray: Matriks invers
     """
+    if metode == 'lapack':
+        try:
+            return np.linalg.inv(A)
+        except np.linalg.LinAlgError:
+            raise ValueError("Matriks tidak memiliki invers") from None
+    if metode != 'adjoin':
+        raise ValueError(f"Metode tidak dikenal: {metode}")
+    
     det = determinan_kofaktor(A)
     if det == 0:
         raise ValueError("Matriks tidak memiliki invers")
@@ -129,17 +201,19 @@ def visualisasi_langkah(langkah, judul):
         langkah (list): Daftar matriks yang menunjukkan langkah-langkah eliminasi
         judul (str): Judul untuk plot
     """
-    fig, axes = plt.subplots(1, len(langkah), figsize=(4*len(langkah), 4))
-    if len(langkah) == 1:
-        axes = [axes]
+    fig, axes = plt.subplots(1, len(langkah), figsize=(4*len(langkah), 4), squeeze=False)
+    
+    # Normalisasi warna dihitung sekali dan dipakai bersama oleh semua langkah
+    data = np.stack(langkah, axis=0)
+    norm = plt.Normalize(data.min(), data.max())
     
-    for i, step in enumerate(langkah):
-        axes[i].imshow(step, cmap='coolwarm')
-        axes[i].set_title(f'Langkah {i+1}')
-        axes[i].axis('off')
+    for i, (ax, step) in enumerate(zip(axes[0], langkah)):
+        ax.imshow(step, cmap='coolwarm', norm=norm, interpolation='nearest')
+        ax.set_title(f'Langkah {i+1}')
+        ax.axis('off')
     
-    plt.suptitle(judul)
-    plt.tight_layout()
+    fig.suptitle(judul)
+    fig.subplots_adjust(left=0.02, right=0.98, bottom=0.02, top=0.85, wspace=0.1)
     plt.show()
 
 # Menyelesaikan sistem persamaan
@@ -154,8 +228,16 @@ A = np.array([[4, -1, -1],
               [-1, -1, 5]], dtype=float)
 b = np.array([5, 3, 4], dtype=float)
 
+# Set True untuk membandingkan invers LAPACK dengan metode adjoin (n^2 + 1 determinan)
+verifikasi_adjoin = False
+
+# Solusi acuan menggunakan LAPACK untuk memverifikasi metode manual
+solusi_ref = np.linalg.solve(A, b)
+
 # Penyelesaian menggunakan eliminasi Gauss
 solusi_gauss, langkah_gauss = eliminasi_gauss(A, b)
+if not np.allclose(solusi_gauss, solusi_ref):
+    print("\nPeringatan: solusi eliminasi Gauss berbeda dengan solusi acuan")
 print("\nSolusi Eliminasi Gauss:")
 print(f"I₁ = {solusi_gauss[0]:.2f}")
 print(f"I₂ = {solusi_gauss[1]:.2f}")
@@ -167,6 +249,8 @@ print(f"\nDeterminan: {det:.2f}")
 
 # Penyelesaian menggunakan Gauss-Jordan
 solusi_jordan, langkah_jordan = gauss_jordan(A, b)
+if not np.allclose(solusi_jordan, solusi_ref):
+    print("\nPeringatan: solusi Gauss-Jordan berbeda dengan solusi acuan")
 print("\nSolusi Gauss-Jordan:")
 print(f"I₁ = {solusi_jordan[0]:.2f}")
 print(f"I₂ = {solusi_jordan[1]:.2f}")
@@ -174,9 +258,11 @@ print(f"I₃ = {solusi_jordan[2]:.2f}")
 
 # Menghitung invers
 invers = invers_matriks_adjoin(A)
+if verifikasi_adjoin and not np.allclose(invers, invers_matriks_adjoin(A, metode='adjoin')):
+    print("\nPeringatan: invers LAPACK berbeda dengan invers metode adjoin")
 print("\nMatriks Invers:")
 print(invers)
 
 # Visualisasi langkah-langkah eliminasi
-visualisasi_langkah(langkah_gauss[:4], "Langkah-langkah Eliminasi Gauss")
-visualisasi_langkah(langkah_jordan[:4], "Langkah-langkah Eliminasi Gauss-Jordan")
\ No newline at end of file
+visualisasi_langkah(langkah_gauss, "Langkah-langkah Eliminasi Gauss")
+visualisasi_langkah(langkah_jordan, "Langkah-langkah Eliminasi Gauss-Jordan")
\ No newline at end of file